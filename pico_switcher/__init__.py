@@ -7,8 +7,10 @@ re-deriving repo layout details in multiple places.
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
+# `abspath` avoids the per-component lstat walk of `Path.resolve()` at import time.
+PROJECT_ROOT = Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 RUNTIME_ROOT = PROJECT_ROOT / ".pico-switcher"
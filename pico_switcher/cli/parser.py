@@ -16,6 +16,9 @@ from ..pico_switch import DEFAULT_BOOTSEL_TIMEOUT, DEFAULT_DETECT_TIMEOUT, DEFAU
 from ..pico_systemd import DEFAULT_SERVICE_NAME, DEFAULT_TIMER_INTERVAL, DEFAULT_UNIT_DIR
 
 
+_PARSER_CACHE: tuple[SwitcherConfig, argparse.ArgumentParser] | None = None
+
+
 def add_common_switch_args(
     parser: argparse.ArgumentParser,
     *,
@@ -104,6 +107,15 @@ def add_db_arg(parser: argparse.ArgumentParser) -> None:
     )
 
 
+def get_parser(config: SwitcherConfig) -> argparse.ArgumentParser:
+    """Return the CLI parser for `config`, reusing the last one built for an equal config."""
+
+    global _PARSER_CACHE
+    if _PARSER_CACHE is None or _PARSER_CACHE[0] != config:
+        _PARSER_CACHE = (config, build_parser(config))
+    return _PARSER_CACHE[1]
+
+
 def build_parser(config: SwitcherConfig) -> argparse.ArgumentParser:
     """Construct and return the full CLI argument parser."""
 
@@ -14,7 +14,7 @@ from ..pico_log import EventRecorder, create_event_recorder
 from ..pico_profiles import discover_config_path, load_switcher_config
 from ..pico_switch import MIN_POST_SWITCH_DETECT_TIMEOUT, detect_mode_safe
 from . import handlers, history
-from .parser import build_parser
+from .parser import get_parser
 from .utils import (
     expand_path,
     extract_switcher_config_value,
@@ -32,7 +32,7 @@ def run_cli(argv: list[str] | None = None) -> int:
     switcher_config = load_switcher_config(
         discover_config_path(explicit_path=explicit_config_path),
     )
-    parser = build_parser(switcher_config)
+    parser = get_parser(switcher_config)
     args = parser.parse_args(resolved_argv)
     setattr(args, "switcher_config", switcher_config)
     recorder: EventRecorder | None = None
@@ -8,24 +8,27 @@ runtime.
 
 from __future__ import annotations
 
+import contextlib
 import errno
+import functools
 import grp
+import json
 import os
 import pwd
-import shlex
-import shutil
+import re
+import select
 import stat
 import subprocess
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from types import ModuleType
+from typing import TYPE_CHECKING, Iterator, Optional
+
+if TYPE_CHECKING:
+    import ctypes
 
-try:
     import serial  # type: ignore
-    from serial.tools import list_ports  # type: ignore
-except ImportError as exc:  # pragma: no cover - runtime dependency check
-    raise SystemExit("pyserial is required: pip install pyserial") from exc
 
 from .pico_cpp_contract import CPP_BOOTSEL_COMMAND, CPP_RUNTIME_BANNER
 
@@ -36,6 +39,46 @@ SERIAL_PORT_HELP = (
     "Serial port path, or 'auto' to use a single detected /dev/ttyACM* or /dev/ttyUSB* device"
 )
 
+RP2_LABEL = "RPI-RP2"
+# udev-maintained symlinks; their presence lets discovery skip forking lsblk.
+DISK_BY_LABEL_DIR = Path("/dev/disk/by-label")
+SYS_CLASS_BLOCK_DIR = Path("/sys/class/block")
+PROC_MOUNTINFO_PATH = Path("/proc/self/mountinfo")
+_RP2_CACHE_SETTLE_NS = 1_000_000_000
+# `key` is the by-label directory identity and mtime of the last negative lookup.
+_rp2_cache: dict[str, Optional[tuple[int, int, int]]] = {"key": None}
+
+UF2_COPY_CHUNK_SIZE = 1024 * 1024
+# `sendfile` failures that mean "not supported here" rather than a real I/O error.
+_SENDFILE_UNSUPPORTED_ERRNOS = frozenset((errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP, errno.ENOTSUP))
+# Flush errors seen when the bootrom reboots on the final UF2 block and drops off USB.
+_BOOTSEL_GONE_ERRNOS = frozenset((errno.EIO, errno.ENODEV, errno.ENXIO))
+_BOOTSEL_GONE_TIMEOUT = 1.0
+
+# Bounds on one wait between device checks. Waits grow by DEVICE_POLL_BACKOFF
+# so early checks are quick and a slow enumeration is not re-checked in a tight
+# loop; inotify usually wakes the loop sooner.
+DEVICE_POLL_INITIAL_INTERVAL = 0.05
+DEVICE_POLL_MAX_INTERVAL = 0.4
+DEVICE_POLL_BACKOFF = 1.5
+
+_IN_ATTRIB = 0x00000004
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+
+# Managed runtime command followed by the legacy prototype's single-byte trigger.
+_CPP_TRIGGER_BYTES = f"{CPP_BOOTSEL_COMMAND}\n".encode("utf-8") + b"b"
+_PY_BANNER_BYTES = b"FW:PY"
+_CPP_BANNER_BYTES = CPP_RUNTIME_BANNER.encode("ascii")
+# One alternation scans the buffer once for either tag; group 1 names the mode.
+_BANNER_RE = re.compile(b"(" + re.escape(_PY_BANNER_BYTES) + b")|(" + re.escape(_CPP_BANNER_BYTES) + b")")
+_BANNER_TAG_MAX_LEN = max(len(_PY_BANNER_BYTES), len(_CPP_BANNER_BYTES))
+# Bound the banner buffer when a chatty firmware never prints a known tag.
+_BANNER_BUFFER_LIMIT = 16 * 1024
+_BANNER_BUFFER_KEEP = 8 * 1024
+
 
 @dataclass
 class Rp2Device:
@@ -45,9 +88,112 @@ class Rp2Device:
     mountpoint: str
 
 
+class _DirectoryWatch:
+    """Wait for entries to appear in one directory, using inotify when available.
+
+    If the directory does not exist yet (for example `/dev/disk/by-label` before
+    udev has seen any labeled disk), its nearest existing ancestor is watched
+    instead so the directory's creation still wakes the waiter. Without inotify
+    `wait()` degrades to a plain sleep, which matches the historical
+    fixed-interval polling.
+    """
+
+    def __init__(self, directory: Path, mask: int = _IN_CREATE | _IN_MOVED_TO) -> None:
+        self._directory = directory
+        self._mask = mask
+        self._fd: Optional[int] = None
+
+    def __enter__(self) -> "_DirectoryWatch":
+        libc = _inotify_libc()
+        if libc is None:
+            return self
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return self
+        if libc.inotify_add_watch(fd, os.fsencode(_nearest_existing_dir(self._directory)), self._mask) < 0:
+            os.close(fd)
+            return self
+        self._fd = fd
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def wait(self, timeout: float) -> None:
+        """Return after a watched event or once `timeout` seconds have passed."""
+
+        timeout = max(timeout, 0.0)
+        if self._fd is None:
+            time.sleep(timeout)
+            return
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if readable:
+            self._drain()
+
+    def _drain(self) -> None:
+        """Discard queued events; callers re-check device state themselves."""
+
+        assert self._fd is not None
+        try:
+            while os.read(self._fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+
+def _nearest_existing_dir(directory: Path) -> Path:
+    """Return `directory` or its closest ancestor that currently exists."""
+
+    while not directory.is_dir() and directory != directory.parent:
+        directory = directory.parent
+    return directory
+
+
+@functools.lru_cache(maxsize=None)
+def _inotify_libc() -> Optional[ctypes.CDLL]:
+    """Return libc with the inotify entry points configured, or `None`.
+
+    `ctypes` is imported here so CLI commands that never wait skip its import,
+    and the already-loaded C library is opened via `CDLL(None)` instead of
+    `ctypes.util.find_library`, which forks `ldconfig`.
+    """
+
+    import ctypes
+
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+def _serial_port_watch_dir(port: str) -> Path:
+    """Return the directory whose entries signal that `port` may have appeared."""
+
+    if port == DEFAULT_PORT:
+        return Path("/dev")
+    return Path(port).parent
+
+
+def _require_serial() -> ModuleType:
+    """Import pyserial on first use so filesystem-only commands skip its cost."""
+
+    try:
+        import serial  # type: ignore
+        import serial.tools.list_ports  # type: ignore
+    except ImportError as exc:  # pragma: no cover - runtime dependency check
+        raise SystemExit("pyserial is required: pip install pyserial") from exc
+    return serial
+
+
 def list_serial_port_candidates() -> tuple[str, ...]:
     """Return likely USB serial device paths that could belong to a Pico."""
 
+    list_ports = _require_serial().tools.list_ports
     candidates = sorted(
         {
             info.device
@@ -92,6 +238,21 @@ def resolve_serial_port(port: str, verbose: bool) -> str:
     raise RuntimeError(_missing_serial_port_message(port=port, candidates=candidates))
 
 
+def serial_port_present(port: str) -> bool:
+    """Return whether `port` could currently resolve, without opening it.
+
+    This is a cheap existence check that mirrors the fallbacks in
+    :func:`resolve_serial_port`; access and ambiguity errors are left for that
+    function to report.
+    """
+
+    if port != DEFAULT_PORT and Path(port).exists():
+        return True
+    if port in (DEFAULT_PORT, "/dev/ttyACM0"):
+        return bool(list_serial_port_candidates())
+    return False
+
+
 def _ensure_serial_port_access(port: str) -> str:
     """Return `port` when readable/writable, else raise a practical Linux fix."""
 
@@ -143,26 +304,15 @@ def _missing_serial_port_message(port: str, candidates: tuple[str, ...]) -> str:
     )
 
 
-def parse_lsblk_line(line: str) -> dict[str, str]:
-    """Parse one `lsblk -P` output line into a key/value mapping.
-
-    Args:
-        line: Raw output line containing shell-quoted `KEY="VALUE"` tokens.
-
-    Returns:
-        Dictionary of parsed key/value pairs.
-    """
-
-    values: dict[str, str] = {}
-    for part in shlex.split(line):
-        key, raw_value = part.split("=", 1)
-        values[key] = raw_value
-    return values
-
-
 def find_rpi_rp2() -> Optional[Rp2Device]:
     """Locate the Pico BOOTSEL mass-storage device, if present.
 
+    When udev maintains `/dev/disk/by-label`, the lookup is a `readlink`, one
+    sysfs read, and one `/proc/self/mountinfo` read. A negative result is
+    remembered until that directory changes, so repeated polls while the
+    device is absent cost a single `stat`. `lsblk` is only forked on hosts
+    without that tree.
+
     Returns:
         A populated :class:`Rp2Device` when a device labeled `RPI-RP2` exists,
         else `None`.
@@ -171,20 +321,94 @@ def find_rpi_rp2() -> Optional[Rp2Device]:
         RuntimeError: If `lsblk` itself fails.
     """
 
-    # Some lsblk versions treat --pairs (-P) as mutually exclusive with --raw (-r).
-    cmd = ["lsblk", "-P", "-n", "-o", "NAME,LABEL,MOUNTPOINT"]
-    result = subprocess.run(cmd, check=False, capture_output=True, text=True)
+    try:
+        dir_stat = DISK_BY_LABEL_DIR.stat()
+    except OSError:
+        return _find_rpi_rp2_lsblk()
+    cache_key = (dir_stat.st_dev, dir_stat.st_ino, dir_stat.st_mtime_ns)
+    if _rp2_cache["key"] == cache_key:
+        return None
+
+    rp2 = _fast_find_rpi_rp2()
+    # Only absence is cached: a present device can be (un)mounted without touching
+    # the directory. Skip very recent mtimes, which a coarse clock may not advance.
+    settled = time.time_ns() - dir_stat.st_mtime_ns > _RP2_CACHE_SETTLE_NS
+    _rp2_cache["key"] = cache_key if rp2 is None and settled else None
+    return rp2
+
+
+def _fast_find_rpi_rp2() -> Optional[Rp2Device]:
+    """Resolve the BOOTSEL device from the udev by-label symlink and sysfs."""
+
+    try:
+        target = os.readlink(DISK_BY_LABEL_DIR / RP2_LABEL)
+    except OSError:
+        return None
+    name = os.path.basename(target)
+    try:
+        device_number = (SYS_CLASS_BLOCK_DIR / name / "dev").read_text(encoding="ascii").strip()
+    except OSError:
+        # Stale symlink: the block device has already gone away.
+        return None
+    return Rp2Device(name=name, mountpoint=_lookup_mountinfo(device_number) or "")
+
+
+def _lookup_mountinfo(device_number: str) -> Optional[str]:
+    """Return the first mountpoint of the block device `major:minor` in mountinfo."""
+
+    try:
+        mountinfo = PROC_MOUNTINFO_PATH.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return None
+    for line in mountinfo.splitlines():
+        # Fields: mount ID, parent ID, major:minor, root, mountpoint, ...
+        fields = line.split(" ", 5)
+        if len(fields) >= 5 and fields[2] == device_number:
+            return _unescape_mount_field(fields[4])
+    return None
+
+
+def _unescape_mount_field(value: str) -> str:
+    """Decode the octal escapes (`\\040` etc.) used in mount table fields."""
+
+    return re.sub(r"\\([0-7]{3})", lambda match: chr(int(match.group(1), 8)), value)
+
+
+def _find_rpi_rp2_lsblk() -> Optional[Rp2Device]:
+    """Locate the BOOTSEL device by scanning `lsblk` JSON output."""
+
+    cmd = ["lsblk", "-J", "-o", "NAME,LABEL,MOUNTPOINT"]
+    result = _run_device_command(cmd)
     if result.returncode != 0:
         raise RuntimeError(result.stderr.strip() or "lsblk failed")
-    for line in result.stdout.splitlines():
-        if not line.strip():
-            continue
-        entry = parse_lsblk_line(line)
-        if entry.get("LABEL") == "RPI-RP2":
-            return Rp2Device(name=entry["NAME"], mountpoint=entry.get("MOUNTPOINT", ""))
+    try:
+        tree = json.loads(result.stdout)
+    except ValueError as exc:
+        raise RuntimeError(f"lsblk returned invalid JSON: {exc}") from exc
+    for entry in _walk_lsblk_devices(tree.get("blockdevices", [])):
+        if entry.get("label") == RP2_LABEL:
+            return Rp2Device(name=entry["name"], mountpoint=entry.get("mountpoint") or "")
     return None
 
 
+def _walk_lsblk_devices(devices: list[dict]) -> Iterator[dict]:
+    """Yield `lsblk -J` entries depth-first, including nested partitions."""
+
+    for entry in devices:
+        yield entry
+        yield from _walk_lsblk_devices(entry.get("children", []))
+
+
+def _run_device_command(cmd: list[str]) -> subprocess.CompletedProcess[str]:
+    """Run a short-lived block-device tool and capture its output.
+
+    Python creates descriptors non-inheritable (PEP 446), so `close_fds=False`
+    leaks nothing into the child and skips the close-all-fds pass before exec.
+    """
+
+    return subprocess.run(cmd, check=False, capture_output=True, text=True, close_fds=False)
+
+
 def ensure_rpi_rp2_mounted(mount_base: str, verbose: bool) -> Path:
     """Return a mounted RPI-RP2 path, mounting manually if needed.
 
@@ -211,13 +435,22 @@ def ensure_rpi_rp2_mounted(mount_base: str, verbose: bool) -> Path:
         print(f"Mounting /dev/{rp2.name} at {mountpoint}...")
     mountpoint.mkdir(parents=True, exist_ok=True)
     mount_cmd = ["mount", f"/dev/{rp2.name}", str(mountpoint)]
-    result = subprocess.run(mount_cmd, check=False, capture_output=True, text=True)
+    result = _run_device_command(mount_cmd)
     if result.returncode != 0:
         message = result.stderr.strip() or result.stdout.strip() or "mount failed"
         raise RuntimeError(f"Failed to mount /dev/{rp2.name}: {message}")
     return mountpoint
 
 
+def _poll_delays() -> Iterator[float]:
+    """Yield exponentially growing wait intervals, capped at the maximum."""
+
+    delay = DEVICE_POLL_INITIAL_INTERVAL
+    while True:
+        yield delay
+        delay = min(delay * DEVICE_POLL_BACKOFF, DEVICE_POLL_MAX_INTERVAL)
+
+
 def wait_for_bootsel_mount(timeout: float, mount_base: str, verbose: bool) -> Path:
     """Wait until the BOOTSEL drive appears and return its mountpoint.
 
@@ -233,19 +466,31 @@ def wait_for_bootsel_mount(timeout: float, mount_base: str, verbose: bool) -> Pa
         RuntimeError: If the drive is not available before timeout.
     """
 
-    deadline = time.time() + timeout
+    deadline = time.monotonic() + timeout
     last_error: Optional[str] = None
-    while time.time() < deadline:
-        try:
-            return ensure_rpi_rp2_mounted(mount_base=mount_base, verbose=verbose)
-        except RuntimeError as exc:
-            last_error = str(exc)
-            time.sleep(0.2)
+    delays = _poll_delays()
+    with _DirectoryWatch(DISK_BY_LABEL_DIR) as watch:
+        while time.monotonic() < deadline:
+            try:
+                return ensure_rpi_rp2_mounted(mount_base=mount_base, verbose=verbose)
+            except RuntimeError as exc:
+                last_error = str(exc)
+                watch.wait(min(next(delays), deadline - time.monotonic()))
     raise RuntimeError(last_error or "Timed out waiting for RPI-RP2")
 
 
 def copy_uf2(uf2_path: Path, mountpoint: Path, verbose: bool) -> None:
-    """Copy a UF2 file to the BOOTSEL drive and flush filesystem buffers.
+    """Copy a UF2 file to the BOOTSEL drive and flush it to the device.
+
+    The copy runs in-kernel via `sendfile` and only the destination file is
+    flushed with `fdatasync`, so unrelated dirty pages on the host do not delay
+    the flash.
+
+    Once the last block arrives the bootrom reboots and leaves USB, so the
+    trailing metadata writes of the flush can fail with `EIO`/`ENODEV`/`ENXIO`.
+    Such an error is only accepted when every byte was handed to the kernel and
+    the `RPI-RP2` drive has since disappeared; otherwise the image may not have
+    reached the device and the error is raised.
 
     Args:
         uf2_path: Source UF2 file path.
@@ -256,12 +501,92 @@ def copy_uf2(uf2_path: Path, mountpoint: Path, verbose: bool) -> None:
         RuntimeError: If the UF2 source path does not exist.
     """
 
-    if not uf2_path.exists():
-        raise RuntimeError(f"UF2 file not found: {uf2_path}")
+    destination = mountpoint / uf2_path.name
+    try:
+        # Opening the source is the existence check, so there is no separate stat to race.
+        src_fd = os.open(uf2_path, os.O_RDONLY)
+    except FileNotFoundError as exc:
+        raise RuntimeError(f"UF2 file not found: {uf2_path}") from exc
     if verbose:
         print(f"Copying {uf2_path} -> {mountpoint}")
-    shutil.copy2(uf2_path, mountpoint / uf2_path.name)
-    os.sync()
+    try:
+        dst_fd = os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        complete = False
+        try:
+            size = os.fstat(src_fd).st_size
+            complete = _copy_file_contents(src_fd, dst_fd, size) == size
+            # Data plus the size/allocation metadata needed to read it back; timestamps can lag.
+            os.fdatasync(dst_fd)
+        except OSError as exc:
+            if not (complete and _bootsel_rebooted(exc)):
+                raise
+            if verbose:
+                print(f"BOOTSEL drive left USB while flushing ({exc.strerror}); the device rebooted")
+        finally:
+            try:
+                os.close(dst_fd)
+            except OSError as exc:
+                if not (complete and _bootsel_rebooted(exc)):
+                    raise
+    finally:
+        os.close(src_fd)
+
+
+def _copy_file_contents(src_fd: int, dst_fd: int, size: int) -> int:
+    """Copy up to `size` bytes between file descriptors, in-kernel where possible.
+
+    `sendfile` handles the usual host-disk to vfat copy. `copy_file_range` is
+    not tried because the BOOTSEL drive is always a different filesystem and
+    recent kernels reject cross-filesystem ranges with `EXDEV`. Filesystems or
+    platforms without `sendfile` support fall back to 1 MiB `pread`/`write`.
+
+    Returns:
+        Number of bytes copied; less than `size` only if the source shrank.
+    """
+
+    offset = 0
+    try:
+        while offset < size:
+            sent = os.sendfile(dst_fd, src_fd, offset, min(size - offset, UF2_COPY_CHUNK_SIZE))
+            if sent == 0:
+                return offset
+            offset += sent
+        return offset
+    except AttributeError:
+        pass
+    except OSError as exc:
+        if exc.errno not in _SENDFILE_UNSUPPORTED_ERRNOS:
+            raise
+    while offset < size:
+        chunk = os.pread(src_fd, min(size - offset, UF2_COPY_CHUNK_SIZE), offset)
+        if not chunk:
+            return offset
+        view = memoryview(chunk)
+        while view:
+            written = os.write(dst_fd, view)
+            view = view[written:]
+        offset += len(chunk)
+    return offset
+
+
+def _bootsel_rebooted(exc: OSError) -> bool:
+    """Return whether a flush error coincides with the BOOTSEL drive disappearing.
+
+    udev can take a moment to drop the by-label link after USB disconnect, so
+    the drive is re-checked for up to `_BOOTSEL_GONE_TIMEOUT` seconds.
+    """
+
+    if exc.errno not in _BOOTSEL_GONE_ERRNOS:
+        return False
+    deadline = time.monotonic() + _BOOTSEL_GONE_TIMEOUT
+    delays = _poll_delays()
+    with _DirectoryWatch(DISK_BY_LABEL_DIR, mask=_IN_DELETE | _IN_MOVED_FROM) as watch:
+        while find_rpi_rp2() is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            watch.wait(min(next(delays), remaining))
+    return True
 
 
 def wait_for_serial_port(port: str, timeout: float, verbose: bool) -> str:
@@ -279,25 +604,89 @@ def wait_for_serial_port(port: str, timeout: float, verbose: bool) -> str:
         RuntimeError: If the port is not available before timeout.
     """
 
-    deadline = time.time() + timeout
+    deadline = time.monotonic() + timeout
     last_error: Optional[str] = None
-    while time.time() < deadline:
-        try:
-            resolved_port = resolve_serial_port(port=port, verbose=verbose)
-            if verbose:
-                print(f"Serial port available: {resolved_port}")
-            return resolved_port
-        except RuntimeError as exc:
-            last_error = str(exc)
-        time.sleep(0.2)
+    delays = _poll_delays()
+    # IN_ATTRIB also fires when udev fixes up the tty group/mode after creation.
+    with _DirectoryWatch(_serial_port_watch_dir(port), mask=_IN_CREATE | _IN_MOVED_TO | _IN_ATTRIB) as watch:
+        while time.monotonic() < deadline:
+            try:
+                resolved_port = resolve_serial_port(port=port, verbose=verbose)
+                if verbose:
+                    print(f"Serial port available: {resolved_port}")
+                return resolved_port
+            except RuntimeError as exc:
+                last_error = str(exc)
+            watch.wait(min(next(delays), deadline - time.monotonic()))
     raise RuntimeError(last_error or f"Timed out waiting for serial port: {port}")
 
 
+class SerialSession:
+    """Lazily opened serial connection shared by several steps of one workflow.
+
+    Banner detection and the C++ BOOTSEL trigger talk to the same tty. Passing
+    one session to both avoids a second open, which on USB CDC repeats the
+    termios setup and DTR toggle and can reset some firmwares. The handle can
+    be closed and reopened, e.g. around `mpremote` calls that open the port
+    themselves.
+    """
+
+    def __init__(self, port: str, verbose: bool = False, baud: int = 115200) -> None:
+        self.port = port
+        self.verbose = verbose
+        self.baud = baud
+        self._stack = contextlib.ExitStack()
+        self._serial: Optional[serial.Serial] = None
+
+    def __enter__(self) -> "SerialSession":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def open(self) -> serial.Serial:
+        """Return the open serial handle, opening the port on first use."""
+
+        if self._serial is not None:
+            return self._serial
+        pyserial = _require_serial()
+        resolved_port = resolve_serial_port(port=self.port, verbose=self.verbose)
+        try:
+            handle = self._stack.enter_context(pyserial.Serial(resolved_port, baudrate=self.baud, timeout=0.2))
+        except (OSError, pyserial.SerialException) as exc:
+            if _is_serial_permission_error(exc):
+                raise RuntimeError(_serial_permission_message(resolved_port)) from exc
+            raise
+        _enable_low_latency(handle)
+        self._serial = handle
+        return handle
+
+    def read_banner(self, timeout: float = 1.0) -> tuple[Optional[str], str]:
+        """Read a firmware banner through this session; see :func:`read_banner`."""
+
+        return read_banner(port=self.port, baud=self.baud, timeout=timeout, verbose=self.verbose, session=self)
+
+    def trigger_from_cpp(self) -> None:
+        """Send the C++ BOOTSEL trigger through this session; see :func:`trigger_from_cpp`."""
+
+        trigger_from_cpp(port=self.port, verbose=self.verbose, session=self)
+
+    def close(self) -> None:
+        """Close the handle if open; a device that already re-enumerated is ignored."""
+
+        self._serial = None
+        try:
+            self._stack.close()
+        except OSError:
+            pass
+
+
 def read_banner(
     port: str,
     baud: int = 115200,
     timeout: float = 1.0,
     verbose: bool = False,
+    session: Optional[SerialSession] = None,
 ) -> tuple[Optional[str], str]:
     """Read serial output and infer firmware mode from known banner tags.
 
@@ -306,55 +695,119 @@ def read_banner(
         baud: Serial baud rate.
         timeout: Maximum time in seconds to read banner output.
         verbose: Whether to print port auto-resolution details.
+        session: Optional already-shared serial session; when given, its handle
+            is used and left open for the caller.
 
     Returns:
         Tuple of `(mode, last_line)` where mode is `"py"`, `"cpp"`, or `None`.
     """
 
-    last_line = ""
-    resolved_port = resolve_serial_port(port=port, verbose=verbose)
+    if session is not None:
+        return _read_banner_from(session.open(), timeout)
+    with SerialSession(port=port, verbose=verbose, baud=baud) as own_session:
+        return _read_banner_from(own_session.open(), timeout)
+
+
+def _read_banner_from(ser: serial.Serial, timeout: float) -> tuple[Optional[str], str]:
+    """Read banner output from an open serial handle for up to `timeout` seconds."""
+
+    ser.reset_input_buffer()
+    fd = ser.fileno()
+    buf = bytearray()
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        # Block in the kernel until bytes arrive instead of spinning on short readline() timeouts.
+        readable, _, _ = select.select([fd], [], [], remaining)
+        if not readable:
+            break
+        chunk = os.read(fd, 4096)
+        if not chunk:
+            break
+        # Only the new bytes, plus enough overlap for a tag split across reads, need scanning.
+        scan_from = max(len(buf) - _BANNER_TAG_MAX_LEN + 1, 0)
+        buf += chunk
+        match = _find_banner(buf, scan_from)
+        if match is not None:
+            return match
+        if len(buf) > _BANNER_BUFFER_LIMIT:
+            del buf[:-_BANNER_BUFFER_KEEP]
+    return None, _last_banner_line(buf)
+
+
+def _enable_low_latency(ser: serial.Serial) -> None:
+    """Best-effort `ASYNC_LOW_LATENCY` so the tty driver does not batch reads.
+
+    pyserial issues the `TIOCGSERIAL`/`TIOCSSERIAL` ioctl pair on POSIX. Drivers
+    that do not implement it (and non-Linux hosts) are left unchanged.
+    """
+
+    set_low_latency_mode = getattr(ser, "set_low_latency_mode", None)
+    if set_low_latency_mode is None:
+        return
     try:
-        with serial.Serial(resolved_port, baudrate=baud, timeout=0.1) as ser:
-            ser.reset_input_buffer()
-            deadline = time.time() + timeout
-            while time.time() < deadline:
-                raw = ser.readline()
-                if not raw:
-                    continue
-                line = raw.decode(errors="ignore").strip()
-                last_line = line
-                if "FW:PY" in line:
-                    return "py", line
-                if CPP_RUNTIME_BANNER in line:
-                    return "cpp", line
-    except (OSError, serial.SerialException) as exc:
-        if _is_serial_permission_error(exc):
-            raise RuntimeError(_serial_permission_message(resolved_port)) from exc
-        raise
-    return None, last_line
-
-
-def trigger_from_cpp(port: str, verbose: bool) -> None:
+        set_low_latency_mode(True)
+    except (OSError, ValueError):
+        pass
+
+
+def _find_banner(buf: bytearray, start: int = 0) -> Optional[tuple[str, str]]:
+    """Return `(mode, line)` for the earliest banner tag in `buf[start:]`, if any.
+
+    The tags are plain ASCII, so the raw bytes are scanned once by a compiled
+    pattern and only the one line containing the hit is decoded.
+    """
+
+    match = _BANNER_RE.search(buf, start)
+    if match is None:
+        return None
+    mode = "py" if match.lastindex == 1 else "cpp"
+    line_start = buf.rfind(b"\n", 0, match.start()) + 1
+    line_end = buf.find(b"\n", match.end())
+    if line_end < 0:
+        line_end = len(buf)
+    return mode, buf[line_start:line_end].decode(errors="ignore").strip()
+
+
+def _last_banner_line(buf: bytearray) -> str:
+    """Return the last non-empty line seen in the banner buffer."""
+
+    for raw in reversed(buf.rsplit(b"\n", 2)):
+        line = raw.decode(errors="ignore").strip()
+        if line:
+            return line
+    return ""
+
+
+def trigger_from_cpp(port: str, verbose: bool, session: Optional[SerialSession] = None) -> None:
     """Send the BOOTSEL trigger command expected by C++ firmware.
 
     Args:
         port: Serial device path.
         verbose: Whether to print trigger activity.
+        session: Optional already-shared serial session, e.g. the one used for
+            banner detection.
 
     The managed runtime expects a reserved text command (`BOOTSEL\n`). To keep
     switching compatible with already-flashed legacy prototype firmware, the
-    host also appends the older single-byte `b` trigger as a fallback.
+    host also appends the older single-byte `b` trigger as a fallback. Both
+    firmwares consume stdin byte by byte, so the two triggers go out in one
+    write.
     """
 
     if verbose:
         print("Triggering BOOTSEL from C++ firmware...")
-    resolved_port = resolve_serial_port(port=port, verbose=verbose)
-    try:
-        with serial.Serial(resolved_port, baudrate=115200, timeout=0.2) as ser:
-            ser.write(f"{CPP_BOOTSEL_COMMAND}\n".encode("utf-8"))
-            ser.write(b"b")
-            ser.flush()
-    except (OSError, serial.SerialException) as exc:
-        if _is_serial_permission_error(exc):
-            raise RuntimeError(_serial_permission_message(resolved_port)) from exc
-        raise
+    if session is not None:
+        _write_cpp_trigger(session.open())
+        return
+    with SerialSession(port=port, verbose=verbose) as own_session:
+        _write_cpp_trigger(own_session.open())
+
+
+def _write_cpp_trigger(ser: serial.Serial) -> None:
+    """Write the BOOTSEL trigger bytes and wait until they have left the host."""
+
+    ser.write(_CPP_TRIGGER_BYTES)
+    ser.flush()
@@ -191,15 +191,19 @@ def sync_managed_python_profile(
         _copy_client_tree(source_dir=plan.source_dir, destination_dir=app_stage_dir)
 
         _remove_remote_app_dir(port=port, verbose=verbose)
-        run_mpremote(["connect", port, "fs", "cp", "-r", str(app_stage_dir), ":"], quiet=not verbose)
+        run_mpremote(
+            ["connect", port, "fs", "cp", "-r", str(app_stage_dir), ":"],
+            quiet=not verbose,
+            discard_stdout=True,
+        )
 
         for file_name, file_path in plan.runtime_template_files.items():
-            run_mpremote(["connect", port, "fs", "cp", str(file_path), ":"], quiet=not verbose)
+            run_mpremote(["connect", port, "fs", "cp", str(file_path), ":"], quiet=not verbose, discard_stdout=True)
 
         for file_name, content in plan.generated_files.items():
             staged_file = staging_root / file_name
             staged_file.write_text(content, encoding="utf-8")
-            run_mpremote(["connect", port, "fs", "cp", str(staged_file), ":"], quiet=not verbose)
+            run_mpremote(["connect", port, "fs", "cp", str(staged_file), ":"], quiet=not verbose, discard_stdout=True)
 
 
 def _copy_client_tree(*, source_dir: Path, destination_dir: Path) -> None:
@@ -7,9 +7,15 @@ and copying switcher-owned files to the Pico filesystem.
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import io
+import os
+import re
 import subprocess
 from pathlib import Path
-from typing import Iterable, Optional
+from types import ModuleType
+from typing import Any, Iterable, Iterator, Optional
 
 from . import PROJECT_ROOT
 from .pico_device import resolve_serial_port
@@ -19,6 +25,9 @@ DEFAULT_HELPER_FILES = (
     PROJECT_ROOT / "py" / "boot.py",
     PROJECT_ROOT / "py" / "bootloader_trigger.py",
 )
+PY_PROBE_CODE = "print('FW:PY')"
+# Same payload as `mpremote bootloader`; the short sleep lets the raw-REPL ack leave USB first.
+PY_BOOTLOADER_CODE = "import time, machine; time.sleep_ms(100); machine.bootloader()"
 
 
 def _format_mpremote_error(result: subprocess.CompletedProcess[str]) -> str:
@@ -31,6 +40,7 @@ def run_mpremote(
     args: list[str],
     quiet: bool = False,
     allow_error: bool = False,
+    discard_stdout: bool = False,
 ) -> subprocess.CompletedProcess[str]:
     """Run `mpremote` and optionally raise on non-zero exit.
 
@@ -38,6 +48,9 @@ def run_mpremote(
         args: Arguments passed to `mpremote`.
         quiet: If `True`, capture stdout/stderr for controlled error reporting.
         allow_error: If `True`, return failures instead of raising.
+        discard_stdout: With `quiet`, send stdout to `/dev/null` and capture
+            only stderr. Suitable for commands such as `fs cp` whose failures
+            are reported on stderr; device-side `exec` tracebacks go to stdout.
 
     Returns:
         The completed process object.
@@ -47,10 +60,16 @@ def run_mpremote(
     """
 
     cmd = ["mpremote", *args]
+    stdout = None
+    stderr = None
+    if quiet:
+        stdout = subprocess.DEVNULL if discard_stdout else subprocess.PIPE
+        stderr = subprocess.PIPE
     result = subprocess.run(
         cmd,
         check=False,
-        capture_output=quiet,
+        stdout=stdout,
+        stderr=stderr,
         text=True,
     )
     if result.returncode != 0 and not allow_error:
@@ -61,20 +80,200 @@ def run_mpremote(
     return result
 
 
-def probe_micropython(port: str, verbose: bool) -> bool:
+# mpremote internals the in-process session relies on. `transport_serial` is not
+# a public API, so the session is limited to releases it was verified against
+# (matching the bound in requirements.txt); re-check these on every mpremote bump.
+_MPREMOTE_TRANSPORT_METHODS = ("enter_raw_repl", "exit_raw_repl", "exec", "exec_raw_no_follow", "fs_writefile", "close")
+_MPREMOTE_MIN_VERSION = (1, 25)
+_MPREMOTE_MAX_VERSION = (2, 0)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_mpremote_transport() -> Optional[ModuleType]:
+    """Import mpremote's serial transport, or return `None` if it is unusable here.
+
+    `mpremote` may only be installed as a command (e.g. via pipx), or be a
+    release outside the verified range whose internal transport API may have
+    changed. Either way callers fall back to running the `mpremote` subprocess.
+    """
+
+    if not _mpremote_version_supported():
+        return None
+    try:
+        from mpremote import transport_serial  # type: ignore
+    except ImportError:
+        return None
+    serial_transport = getattr(transport_serial, "SerialTransport", None)
+    if serial_transport is None or not hasattr(transport_serial, "TransportError"):
+        return None
+    if not all(hasattr(serial_transport, name) for name in _MPREMOTE_TRANSPORT_METHODS):
+        return None
+    return transport_serial
+
+
+def _mpremote_version_supported() -> bool:
+    """Return whether the installed mpremote distribution is in the verified range."""
+
+    import importlib.metadata
+
+    try:
+        version = importlib.metadata.version("mpremote")
+    except importlib.metadata.PackageNotFoundError:
+        return False
+    parts = re.findall(r"\d+", version)[:2]
+    if len(parts) < 2:
+        return False
+    release = (int(parts[0]), int(parts[1]))
+    return _MPREMOTE_MIN_VERSION <= release < _MPREMOTE_MAX_VERSION
+
+
+def _require_mpremote_transport() -> ModuleType:
+    """Return mpremote's serial transport for a session that is already in use."""
+
+    transport_serial = _load_mpremote_transport()
+    if transport_serial is None:
+        raise RuntimeError("mpremote's serial transport is not importable; use the mpremote command instead")
+    return transport_serial
+
+
+class MpRemoteSession:
+    """In-process `mpremote` raw-REPL connection shared by several commands.
+
+    Each `mpremote` subprocess re-imports the tool and renegotiates raw-REPL
+    entry on the device. A session drives mpremote's own serial transport
+    instead, so a probe followed by a bootloader trigger (or a batch of file
+    writes) pays for one connection. The transport is opened lazily and holds
+    the port exclusively until :meth:`close`.
+
+    This relies on mpremote's internal `transport_serial.SerialTransport`
+    (raw-REPL entry with soft reset, `exec` returning bytes, `fs_writefile`),
+    verified for mpremote 1.x only. Nothing is imported until first use; when
+    that transport is unusable, :meth:`available` is `False` and the helpers
+    below run the `mpremote` command instead.
+    """
+
+    def __init__(self, port: str, verbose: bool = False) -> None:
+        self.port = port
+        self.verbose = verbose
+        self._transport: Any = None
+
+    def __enter__(self) -> "MpRemoteSession":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def available(self) -> bool:
+        """Return whether mpremote's in-process transport can be used here."""
+
+        return _load_mpremote_transport() is not None
+
+    def exec(self, code: str) -> str:
+        """Run `code` in the device's raw REPL and return its stdout.
+
+        Raises:
+            RuntimeError: If the device cannot be reached or the code raises.
+        """
+
+        with self._transport_errors():
+            return self._open().exec(code).decode("utf-8", errors="replace")
+
+    def exec_no_follow(self, code: str) -> None:
+        """Start `code` without waiting for output, then drop the connection.
+
+        Used for commands such as `machine.bootloader()` after which the USB
+        device disappears and no reply can arrive.
+        """
+
+        with self._transport_errors():
+            self._open().exec_raw_no_follow(code)
+        self.close()
+
+    def write_file(self, local_path: Path, remote_name: Optional[str] = None) -> None:
+        """Copy one local file into the device's current directory.
+
+        Raises:
+            RuntimeError: If the file cannot be written on the device.
+        """
+
+        data = local_path.read_bytes()
+        with self._transport_errors():
+            self._open().fs_writefile(remote_name or local_path.name, data)
+
+    def close(self) -> None:
+        """Leave the raw REPL and release the port; a vanished device is ignored."""
+
+        transport, self._transport = self._transport, None
+        if transport is None:
+            return
+        with contextlib.suppress(Exception):
+            transport.exit_raw_repl()
+        with contextlib.suppress(Exception):
+            transport.close()
+
+    def _open(self) -> Any:
+        if self._transport is not None:
+            return self._transport
+        transport_serial = _require_mpremote_transport()
+        resolved_port = resolve_serial_port(port=self.port, verbose=self.verbose)
+        with self._transport_errors():
+            transport = transport_serial.SerialTransport(resolved_port, baudrate=115200)
+            try:
+                transport.enter_raw_repl()
+            except BaseException:
+                transport.close()
+                raise
+        self._transport = transport
+        return transport
+
+    @contextlib.contextmanager
+    def _transport_errors(self) -> Iterator[None]:
+        """Map transport failures to `RuntimeError` and keep mpremote's chatter quiet."""
+
+        transport_serial = _require_mpremote_transport()
+        quiet = contextlib.nullcontext() if self.verbose else contextlib.redirect_stdout(io.StringIO())
+        try:
+            with quiet:
+                yield
+        except (OSError, transport_serial.TransportError) as exc:
+            raise RuntimeError(f"mpremote session on {self.port} failed: {_format_transport_error(exc)}") from exc
+
+
+def _format_transport_error(exc: BaseException) -> str:
+    """Return the device-side traceback for exec errors, else the exception text."""
+
+    error_output = getattr(exc, "error_output", None)
+    if error_output:
+        return str(error_output).strip()
+    return str(exc)
+
+
+def probe_micropython(port: str, verbose: bool, session: Optional[MpRemoteSession] = None) -> bool:
     """Probe the device for a responding MicroPython runtime.
 
     Args:
         port: Serial device path for `mpremote connect`.
         verbose: Whether to print probe diagnostics.
+        session: Optional in-process session; it is left connected so a
+            follow-up trigger can reuse it.
 
     Returns:
         `True` when a minimal `mpremote exec` succeeds, otherwise `False`.
     """
 
+    if session is not None and session.available():
+        try:
+            session.exec(PY_PROBE_CODE)
+        except RuntimeError as exc:
+            if verbose:
+                print(f"mpremote probe failed: {exc}")
+            return False
+        if verbose:
+            print("Detected MicroPython via mpremote probe")
+        return True
     resolved_port = resolve_serial_port(port=port, verbose=verbose)
     result = run_mpremote(
-        ["connect", resolved_port, "exec", "print('FW:PY')"],
+        ["connect", resolved_port, "exec", PY_PROBE_CODE],
         quiet=True,
         allow_error=True,
     )
@@ -89,12 +288,14 @@ def probe_micropython(port: str, verbose: bool) -> bool:
     return False
 
 
-def trigger_from_py(port: str, verbose: bool) -> Optional[str]:
+def trigger_from_py(port: str, verbose: bool, session: Optional[MpRemoteSession] = None) -> Optional[str]:
     """Ask MicroPython firmware to enter BOOTSEL mode.
 
     Args:
         port: Serial device path for `mpremote connect`.
         verbose: Whether to print trigger diagnostics.
+        session: Optional in-process session to send the trigger through; it
+            is closed afterwards because the device leaves USB serial.
 
     Returns:
         `None` on success, otherwise a user-facing error summary.
@@ -102,6 +303,14 @@ def trigger_from_py(port: str, verbose: bool) -> Optional[str]:
 
     if verbose:
         print("Triggering BOOTSEL from MicroPython...")
+    if session is not None and session.available():
+        try:
+            session.exec_no_follow(PY_BOOTLOADER_CODE)
+        except RuntimeError as exc:
+            if verbose:
+                print(f"mpremote trigger warning: {exc}")
+            return str(exc)
+        return None
     resolved_port = resolve_serial_port(port=port, verbose=verbose)
     result = run_mpremote(
         ["connect", resolved_port, "bootloader"],
@@ -120,6 +329,7 @@ def install_micropython_helpers(
     port: str,
     helper_files: Iterable[Path] = DEFAULT_HELPER_FILES,
     verbose: bool = False,
+    session: Optional[MpRemoteSession] = None,
 ) -> None:
     """Copy helper files to a MicroPython filesystem via `mpremote`.
 
@@ -128,6 +338,8 @@ def install_micropython_helpers(
         helper_files: Paths that must exist locally before copy. Defaults to the
             repo's bundled `py/boot.py` and `py/bootloader_trigger.py`.
         verbose: Whether to print install progress.
+        session: Optional in-process session to write the files through instead
+            of spawning `mpremote`.
 
     Raises:
         RuntimeError: If any helper file path is missing or copy fails.
@@ -137,15 +349,45 @@ def install_micropython_helpers(
     resolved_port = resolve_serial_port(port=port, verbose=verbose)
     if verbose:
         print(f"Installing MicroPython helper files to {resolved_port}...")
-    for file_path in resolved_files:
-        run_mpremote(["connect", resolved_port, "fs", "cp", str(file_path), ":"], quiet=not verbose)
+    if not resolved_files:
+        return
+    if session is not None and session.available():
+        for file_path in resolved_files:
+            session.write_file(file_path)
+        return
+    # One multi-source `fs cp` shares a single mpremote startup and serial connection.
+    run_mpremote(
+        ["connect", resolved_port, "fs", "cp", *(str(file_path) for file_path in resolved_files), ":"],
+        quiet=not verbose,
+        discard_stdout=True,
+    )
 
 
 def _require_helper_files(helper_files: Iterable[Path]) -> tuple[Path, ...]:
-    """Materialize and validate helper file paths before copy operations."""
+    """Materialize and validate helper file paths before copy operations.
+
+    Each parent directory is listed once instead of stat-ing every file; a
+    parent that cannot be listed falls back to per-file checks.
+    """
 
     resolved_files = tuple(helper_files)
+    listings: dict[Path, Optional[set[str]]] = {}
     for file_path in resolved_files:
-        if not file_path.exists():
+        parent = file_path.parent
+        if parent not in listings:
+            listings[parent] = _list_directory_names(parent)
+        existing = listings[parent]
+        present = file_path.exists() if existing is None else file_path.name in existing
+        if not present:
             raise RuntimeError(f"Missing helper file: {file_path}")
     return resolved_files
+
+
+def _list_directory_names(directory: Path) -> Optional[set[str]]:
+    """Return entry names in `directory`, or `None` if it cannot be listed."""
+
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return None
@@ -10,17 +10,25 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Iterable, Optional
 
-from . import PROJECT_ROOT
 from .pico_device import (
+    SerialSession,
     copy_uf2,
     find_rpi_rp2,
     read_banner,
+    resolve_serial_port,
+    serial_port_present,
     trigger_from_cpp,
     wait_for_bootsel_mount,
     wait_for_serial_port,
 )
 from .pico_log import EventRecorder
-from .pico_mpremote import DEFAULT_HELPER_FILES, install_micropython_helpers, probe_micropython, trigger_from_py
+from .pico_mpremote import (
+    DEFAULT_HELPER_FILES,
+    MpRemoteSession,
+    install_micropython_helpers,
+    probe_micropython,
+    trigger_from_py,
+)
 
 
 DEFAULT_MODE = "auto"
@@ -29,8 +37,6 @@ DEFAULT_BOOTSEL_TIMEOUT = 10.0
 DEFAULT_SERIAL_WAIT = 12.0
 DEFAULT_INSTALL_HELPERS = True
 MIN_POST_SWITCH_DETECT_TIMEOUT = 2.0
-DEFAULT_PY_UF2 = PROJECT_ROOT / "uf2s" / "Pico-MicroPython-20250415-v1.25.0.uf2"
-DEFAULT_CPP_UF2 = PROJECT_ROOT / "uf2s" / "bootloader_trigger.uf2"
 
 
 def detect_mode(
@@ -39,21 +45,33 @@ def detect_mode(
     verbose: bool,
     recorder: Optional[EventRecorder] = None,
     reason: str = "detect",
+    session: Optional[SerialSession] = None,
+    mpremote_session: Optional[MpRemoteSession] = None,
 ) -> Optional[str]:
     """Detect the current firmware mode.
 
     Detection order is intentionally conservative:
     1) BOOTSEL is detected from a present `RPI-RP2` mass-storage device.
-    2) Runtime mode is inferred from serial banner markers (`FW:PY` / `FW:CPP`).
-    3) A MicroPython probe is attempted via `mpremote`.
+    2) If the serial port does not exist, the missing-port error is raised
+       without waiting for a banner.
+    3) Runtime mode is inferred from serial banner markers (`FW:PY` / `FW:CPP`).
+    4) A MicroPython probe is attempted via `mpremote`.
 
     Args:
         port: Serial device path used for banner reads and MicroPython probe.
         timeout: Number of seconds to listen for a serial banner.
         verbose: Whether to print detection details.
+        session: Optional serial session to read the banner through, so a
+            follow-up C++ trigger can reuse the same open port.
+        mpremote_session: Optional in-process `mpremote` session for the
+            MicroPython probe, so a follow-up MicroPython trigger reuses its
+            raw-REPL connection.
 
     Returns:
         `"bootsel"`, `"py"`, `"cpp"`, or `None` if no mode can be determined.
+
+    Raises:
+        RuntimeError: If the serial port is missing or cannot be opened.
     """
 
     rp2 = find_rpi_rp2()
@@ -74,7 +92,11 @@ def detect_mode(
             )
         return "bootsel"
 
-    mode, banner = read_banner(port=port, timeout=timeout, verbose=verbose)
+    if not serial_port_present(port):
+        # Raise the usual missing-port error (with any candidates) without waiting on a banner.
+        resolve_serial_port(port=port, verbose=verbose)
+
+    mode, banner = read_banner(port=port, timeout=timeout, verbose=verbose, session=session)
     if verbose:
         if mode:
             print(f"Detected mode from serial banner: {mode} ({banner})")
@@ -96,7 +118,10 @@ def detect_mode(
             )
         return mode
 
-    if probe_micropython(port=port, verbose=verbose):
+    if session is not None:
+        # mpremote opens the port itself; do not keep a second reader attached.
+        session.close()
+    if probe_micropython(port=port, verbose=verbose, session=mpremote_session):
         if recorder is not None:
             recorder.event(
                 "detect_mode",
@@ -223,20 +248,51 @@ def switch_firmware(
             },
         )
 
-    selected_mode = mode
-    if selected_mode == "auto":
-        selected_mode = (
-            detect_mode(
-                port=port,
-                timeout=detect_timeout,
-                verbose=verbose,
-                recorder=recorder,
-                reason="switch_preflight",
+    # One serial handle serves both banner detection and a C++ BOOTSEL trigger;
+    # likewise one mpremote connection serves the MicroPython probe and trigger.
+    with SerialSession(port=port, verbose=verbose) as serial_session, MpRemoteSession(
+        port=port,
+        verbose=verbose,
+    ) as mpremote_session:
+        selected_mode = mode
+        if selected_mode == "auto":
+            selected_mode = (
+                detect_mode(
+                    port=port,
+                    timeout=detect_timeout,
+                    verbose=verbose,
+                    recorder=recorder,
+                    reason="switch_preflight",
+                    session=serial_session,
+                    mpremote_session=mpremote_session,
+                )
+                or "unknown"
             )
-            or "unknown"
-        )
 
-    if selected_mode == target and not force_flash:
+        skip_flash = selected_mode == target and not force_flash
+        trigger_error: Optional[str] = None
+        if not skip_flash:
+            try:
+                trigger_error = _trigger_bootsel(
+                    selected_mode=selected_mode,
+                    port=port,
+                    verbose=verbose,
+                    session=serial_session,
+                    mpremote_session=mpremote_session,
+                )
+            except Exception as exc:
+                if recorder is not None:
+                    recorder.event(
+                        "bootsel_trigger",
+                        status="error",
+                        mode=selected_mode,
+                        target_mode=target,
+                        port=port,
+                        message=str(exc),
+                    )
+                raise
+
+    if skip_flash:
         if verbose:
             print(f"Already in {target} mode, skipping UF2 flash.")
         if recorder is not None:
@@ -259,19 +315,6 @@ def switch_firmware(
         )
         return False
 
-    try:
-        trigger_error = _trigger_bootsel(selected_mode=selected_mode, port=port, verbose=verbose)
-    except Exception as exc:
-        if recorder is not None:
-            recorder.event(
-                "bootsel_trigger",
-                status="error",
-                mode=selected_mode,
-                target_mode=target,
-                port=port,
-                message=str(exc),
-            )
-        raise
     if recorder is not None:
         recorder.event(
             "bootsel_trigger",
@@ -355,13 +398,22 @@ def switch_firmware(
     return True
 
 
-def _trigger_bootsel(selected_mode: str, port: str, verbose: bool) -> Optional[str]:
+def _trigger_bootsel(
+    selected_mode: str,
+    port: str,
+    verbose: bool,
+    session: Optional[SerialSession] = None,
+    mpremote_session: Optional[MpRemoteSession] = None,
+) -> Optional[str]:
     """Trigger BOOTSEL based on the currently running firmware mode.
 
     Args:
         selected_mode: Resolved current mode (`"py"`, `"cpp"`, or `"bootsel"`).
         port: Serial device path used for trigger commands.
         verbose: Whether to print trigger status.
+        session: Optional serial session reused for the C++ trigger.
+        mpremote_session: Optional `mpremote` session reused for the
+            MicroPython trigger.
 
     Returns:
         Error text from MicroPython trigger attempts, else `None`.
@@ -371,9 +423,11 @@ def _trigger_bootsel(selected_mode: str, port: str, verbose: bool) -> Optional[s
     """
 
     if selected_mode == "py":
-        return trigger_from_py(port=port, verbose=verbose)
+        if session is not None:
+            session.close()
+        return trigger_from_py(port=port, verbose=verbose, session=mpremote_session)
     if selected_mode == "cpp":
-        trigger_from_cpp(port=port, verbose=verbose)
+        trigger_from_cpp(port=port, verbose=verbose, session=session)
         return None
     if selected_mode == "bootsel":
         if verbose:
@@ -397,7 +451,13 @@ def _install_helpers_if_requested(
         return
     try:
         resolved_port = wait_for_serial_port(port=port, timeout=serial_wait, verbose=verbose)
-        install_micropython_helpers(port=resolved_port, helper_files=helper_files, verbose=verbose)
+        with MpRemoteSession(port=resolved_port, verbose=verbose) as mpremote_session:
+            install_micropython_helpers(
+                port=resolved_port,
+                helper_files=helper_files,
+                verbose=verbose,
+                session=mpremote_session,
+            )
     except Exception as exc:
         if recorder is not None:
             recorder.event(
@@ -17,7 +17,7 @@ from unittest import mock
 
 from pico_switcher import PROJECT_ROOT
 from pico_switcher.cli.history import print_history_section
-from pico_switcher.cli.parser import build_parser
+from pico_switcher.cli.parser import build_parser, get_parser
 from pico_switcher.cli.runner import run_cli
 from pico_switcher.cli.utils import extract_switcher_config_value
 from pico_switcher.pico_profiles import load_switcher_config
@@ -52,6 +52,12 @@ class CliParserTests(unittest.TestCase):
         self.assertEqual(to_cpp_args.command, "to-cpp")
         self.assertTrue(to_cpp_args.build)
 
+    def test_get_parser_reuses_parser_for_equal_config(self) -> None:
+        first = get_parser(load_switcher_config(None))
+        second = get_parser(load_switcher_config(None))
+
+        self.assertIs(first, second)
+
 
 class CliRunnerTests(unittest.TestCase):
     def test_run_cli_dispatches_history_without_creating_recorder(self) -> None:
@@ -68,7 +74,7 @@ class CliRunnerTests(unittest.TestCase):
         with mock.patch("pico_switcher.cli.runner.discover_config_path", return_value=None), mock.patch(
             "pico_switcher.cli.runner.load_switcher_config",
             return_value=load_switcher_config(None),
-        ), mock.patch("pico_switcher.cli.runner.build_parser", return_value=parser), mock.patch(
+        ), mock.patch("pico_switcher.cli.runner.get_parser", return_value=parser), mock.patch(
             "pico_switcher.cli.runner.history.run_history",
             return_value=0,
         ) as history_mock, mock.patch("pico_switcher.cli.runner.create_event_recorder") as recorder_factory:
@@ -93,7 +99,7 @@ class CliRunnerTests(unittest.TestCase):
         with mock.patch("pico_switcher.cli.runner.discover_config_path", return_value=None), mock.patch(
             "pico_switcher.cli.runner.load_switcher_config",
             return_value=load_switcher_config(None),
-        ), mock.patch("pico_switcher.cli.runner.build_parser", return_value=parser), mock.patch(
+        ), mock.patch("pico_switcher.cli.runner.get_parser", return_value=parser), mock.patch(
             "pico_switcher.cli.runner.create_event_recorder",
             return_value=recorder,
         ), mock.patch("pico_switcher.cli.runner.handlers.run_build_cpp", return_value=output_uf2) as build_mock, mock.patch(
@@ -122,7 +128,7 @@ class CliRunnerTests(unittest.TestCase):
         with mock.patch("pico_switcher.cli.runner.discover_config_path", return_value=None), mock.patch(
             "pico_switcher.cli.runner.load_switcher_config",
             return_value=load_switcher_config(None),
-        ), mock.patch("pico_switcher.cli.runner.build_parser", return_value=parser), mock.patch(
+        ), mock.patch("pico_switcher.cli.runner.get_parser", return_value=parser), mock.patch(
             "pico_switcher.cli.runner.create_event_recorder",
             return_value=recorder,
         ), mock.patch("pico_switcher.cli.runner.handlers.run_switch", return_value=False) as switch_mock, mock.patch(
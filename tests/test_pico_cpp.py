@@ -151,17 +151,13 @@ class ManagedCppTriggerTests(unittest.TestCase):
         serial_context.__enter__.return_value = serial_handle
 
         with mock.patch("pico_switcher.pico_device.resolve_serial_port", return_value="/dev/ttyACM0"), mock.patch(
-            "pico_switcher.pico_device.serial.Serial",
+            "serial.Serial",
             return_value=serial_context,
         ):
             trigger_from_cpp(port="auto", verbose=False)
 
-        serial_handle.write.assert_has_calls(
-            [
-                mock.call(b"BOOTSEL\n"),
-                mock.call(b"b"),
-            ]
-        )
+        serial_handle.set_low_latency_mode.assert_called_once_with(True)
+        serial_handle.write.assert_called_once_with(b"BOOTSEL\nb")
         serial_handle.flush.assert_called_once()
 
 
@@ -0,0 +1,277 @@
+"""Tests for low-level Pico device helpers.
+
+These tests cover the host-side device I/O paths that do not need real
+hardware: serial banner parsing is exercised against an OS pipe standing in
+for the tty file descriptor, and BOOTSEL discovery against temporary stand-ins
+for the udev by-label tree, sysfs, and `/proc/self/mountinfo`.
+"""
+
+from __future__ import annotations
+
+import errno
+import itertools
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from pico_switcher.pico_device import SerialSession, copy_uf2, find_rpi_rp2, read_banner, wait_for_serial_port
+
+
+class _PipeSerial:
+    """Minimal `serial.Serial` stand-in backed by the read end of a pipe."""
+
+    def __init__(self, fd: int) -> None:
+        self._fd = fd
+
+    def __enter__(self) -> "_PipeSerial":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def reset_input_buffer(self) -> None:
+        return None
+
+
+class ReadBannerTests(unittest.TestCase):
+    def _read_banner_from(self, payload: bytes, timeout: float = 0.2) -> tuple[str | None, str]:
+        read_fd, write_fd = os.pipe()
+        self.addCleanup(os.close, read_fd)
+        try:
+            os.write(write_fd, payload)
+        finally:
+            os.close(write_fd)
+
+        with mock.patch("pico_switcher.pico_device.resolve_serial_port", return_value="/dev/ttyACM0"), mock.patch(
+            "serial.Serial",
+            return_value=_PipeSerial(read_fd),
+        ):
+            return read_banner(port="auto", timeout=timeout)
+
+    def test_read_banner_detects_cpp_runtime_banner(self) -> None:
+        mode, line = self._read_banner_from(b"noise\r\nFW:CPP PROFILE:CPP:demo\r\n")
+
+        self.assertEqual(mode, "cpp")
+        self.assertEqual(line, "FW:CPP PROFILE:CPP:demo")
+
+    def test_read_banner_detects_unterminated_micropython_banner(self) -> None:
+        mode, line = self._read_banner_from(b"FW:PY")
+
+        self.assertEqual(mode, "py")
+        self.assertEqual(line, "FW:PY")
+
+    def test_read_banner_reports_earliest_tag_when_both_appear(self) -> None:
+        mode, line = self._read_banner_from(b"boot\r\nFW:CPP PROFILE:CPP:demo\r\nFW:PY\r\n")
+
+        self.assertEqual(mode, "cpp")
+        self.assertEqual(line, "FW:CPP PROFILE:CPP:demo")
+
+    def test_read_banner_reports_last_line_without_known_banner(self) -> None:
+        mode, line = self._read_banner_from(b"hello\r\nworld\r\n")
+
+        self.assertIsNone(mode)
+        self.assertEqual(line, "world")
+
+
+class SerialSessionTests(unittest.TestCase):
+    def test_session_reads_banner_and_triggers_over_one_open_port(self) -> None:
+        read_fd, write_fd = os.pipe()
+        self.addCleanup(os.close, read_fd)
+        os.write(write_fd, b"FW:CPP\r\n")
+        os.close(write_fd)
+        serial_handle = mock.MagicMock()
+        serial_handle.fileno.return_value = read_fd
+        serial_context = mock.MagicMock()
+        serial_context.__enter__.return_value = serial_handle
+
+        with mock.patch("pico_switcher.pico_device.resolve_serial_port", return_value="/dev/ttyACM0"), mock.patch(
+            "serial.Serial",
+            return_value=serial_context,
+        ) as serial_factory:
+            with SerialSession(port="auto") as session:
+                mode, _ = session.read_banner(timeout=0.2)
+                session.trigger_from_cpp()
+
+        self.assertEqual(mode, "cpp")
+        serial_factory.assert_called_once()
+        serial_handle.write.assert_called_once_with(b"BOOTSEL\nb")
+        serial_context.__exit__.assert_called_once()
+
+
+class FindRpiRp2Tests(unittest.TestCase):
+    def setUp(self) -> None:
+        # The negative-lookup cache is module state; give every test a fresh one.
+        cache_patch = mock.patch("pico_switcher.pico_device._rp2_cache", {"key": None})
+        cache_patch.start()
+        self.addCleanup(cache_patch.stop)
+
+    def test_find_rpi_rp2_uses_by_label_symlink_without_lsblk(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            by_label = Path(tmpdir) / "by-label"
+            by_label.mkdir()
+            (by_label / "RPI-RP2").symlink_to("../../sdb1")
+            sys_block = Path(tmpdir) / "block"
+            (sys_block / "sdb1").mkdir(parents=True)
+            (sys_block / "sdb1" / "dev").write_text("8:17\n", encoding="ascii")
+            mountinfo = Path(tmpdir) / "mountinfo"
+            mountinfo.write_text(
+                "22 1 8:1 / / rw,relatime shared:1 - ext4 /dev/sda1 rw\n"
+                "97 22 8:17 / /media/user/RPI\\040RP2 rw,nosuid - vfat /dev/sdb1 rw\n",
+                encoding="utf-8",
+            )
+
+            with mock.patch("pico_switcher.pico_device.DISK_BY_LABEL_DIR", by_label), mock.patch(
+                "pico_switcher.pico_device.SYS_CLASS_BLOCK_DIR",
+                sys_block,
+            ), mock.patch("pico_switcher.pico_device.PROC_MOUNTINFO_PATH", mountinfo), mock.patch(
+                "pico_switcher.pico_device.subprocess.run"
+            ) as run_mock:
+                rp2 = find_rpi_rp2()
+
+        run_mock.assert_not_called()
+        self.assertIsNotNone(rp2)
+        self.assertEqual(rp2.name, "sdb1")
+        self.assertEqual(rp2.mountpoint, "/media/user/RPI RP2")
+
+    def test_find_rpi_rp2_returns_none_when_label_is_absent(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with mock.patch("pico_switcher.pico_device.DISK_BY_LABEL_DIR", Path(tmpdir)), mock.patch(
+                "pico_switcher.pico_device.subprocess.run"
+            ) as run_mock:
+                rp2 = find_rpi_rp2()
+
+        run_mock.assert_not_called()
+        self.assertIsNone(rp2)
+
+    def test_find_rpi_rp2_reuses_negative_result_until_by_label_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            by_label = Path(tmpdir)
+            (by_label / "OTHER").symlink_to("../../sda1")
+            os.utime(by_label, (1_000_000_000, 1_000_000_000))
+
+            with mock.patch("pico_switcher.pico_device.DISK_BY_LABEL_DIR", by_label), mock.patch(
+                "pico_switcher.pico_device._fast_find_rpi_rp2",
+                return_value=None,
+            ) as fast_mock:
+                self.assertIsNone(find_rpi_rp2())
+                self.assertIsNone(find_rpi_rp2())
+                self.assertEqual(fast_mock.call_count, 1)
+
+                (by_label / "RPI-RP2").symlink_to("../../sdb1")
+                self.assertIsNone(find_rpi_rp2())
+                self.assertEqual(fast_mock.call_count, 2)
+
+    def test_find_rpi_rp2_falls_back_to_lsblk_json_without_by_label_tree(self) -> None:
+        lsblk_output = (
+            '{"blockdevices": [{"name": "sdb", "label": null, "mountpoint": null, '
+            '"children": [{"name": "sdb1", "label": "RPI-RP2", "mountpoint": null}]}]}'
+        )
+        process = mock.Mock(returncode=0, stdout=lsblk_output, stderr="")
+        with mock.patch("pico_switcher.pico_device.DISK_BY_LABEL_DIR", Path("/nonexistent/by-label")), mock.patch(
+            "pico_switcher.pico_device.subprocess.run",
+            return_value=process,
+        ) as run_mock:
+            rp2 = find_rpi_rp2()
+
+        self.assertEqual(run_mock.call_args.args[0][:2], ["lsblk", "-J"])
+        self.assertIsNotNone(rp2)
+        self.assertEqual(rp2.name, "sdb1")
+        self.assertEqual(rp2.mountpoint, "")
+
+
+class WaitForSerialPortTests(unittest.TestCase):
+    def test_wait_for_serial_port_returns_once_device_node_appears(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            port = Path(tmpdir) / "ttyACM9"
+            timer = threading.Timer(0.05, port.touch)
+            timer.start()
+            self.addCleanup(timer.cancel)
+
+            started = time.monotonic()
+            # With a fixed 5 s poll interval only an inotify wake can return within the bound.
+            with mock.patch("pico_switcher.pico_device._poll_delays", return_value=itertools.repeat(5.0)):
+                resolved = wait_for_serial_port(port=str(port), timeout=5.0, verbose=False)
+            elapsed = time.monotonic() - started
+
+        self.assertEqual(resolved, str(port))
+        self.assertLess(elapsed, 1.0)
+
+
+class CopyUf2Tests(unittest.TestCase):
+    def test_copy_uf2_writes_image_to_mountpoint_without_global_sync(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "firmware.uf2"
+            payload = os.urandom(3 * 512 * 1024 + 17)
+            source.write_bytes(payload)
+            mountpoint = Path(tmpdir) / "RPI-RP2"
+            mountpoint.mkdir()
+
+            with mock.patch("pico_switcher.pico_device.os.sync") as sync_mock:
+                copy_uf2(uf2_path=source, mountpoint=mountpoint, verbose=False)
+
+            self.assertEqual((mountpoint / "firmware.uf2").read_bytes(), payload)
+        sync_mock.assert_not_called()
+
+    def test_copy_uf2_falls_back_when_sendfile_is_unsupported(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "firmware.uf2"
+            payload = os.urandom(2 * 1024 * 1024 + 5)
+            source.write_bytes(payload)
+            mountpoint = Path(tmpdir) / "RPI-RP2"
+            mountpoint.mkdir()
+
+            with mock.patch("pico_switcher.pico_device.os.sendfile", side_effect=OSError(errno.EINVAL, "Invalid")):
+                copy_uf2(uf2_path=source, mountpoint=mountpoint, verbose=False)
+
+            self.assertEqual((mountpoint / "firmware.uf2").read_bytes(), payload)
+
+    def test_copy_uf2_treats_flush_error_after_full_copy_as_reboot(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "firmware.uf2"
+            payload = os.urandom(64 * 1024)
+            source.write_bytes(payload)
+            mountpoint = Path(tmpdir) / "RPI-RP2"
+            mountpoint.mkdir()
+
+            with mock.patch(
+                "pico_switcher.pico_device.os.fdatasync",
+                side_effect=OSError(errno.EIO, "Input/output error"),
+            ) as fdatasync_mock, mock.patch("pico_switcher.pico_device.find_rpi_rp2", return_value=None):
+                copy_uf2(uf2_path=source, mountpoint=mountpoint, verbose=False)
+
+            fdatasync_mock.assert_called_once()
+            self.assertEqual((mountpoint / "firmware.uf2").read_bytes(), payload)
+
+    def test_copy_uf2_raises_flush_error_while_drive_is_still_present(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "firmware.uf2"
+            source.write_bytes(os.urandom(64 * 1024))
+            mountpoint = Path(tmpdir) / "RPI-RP2"
+            mountpoint.mkdir()
+            rp2 = mock.Mock(name="sdb1", mountpoint=str(mountpoint))
+
+            with mock.patch(
+                "pico_switcher.pico_device.os.fdatasync",
+                side_effect=OSError(errno.EIO, "Input/output error"),
+            ), mock.patch("pico_switcher.pico_device.find_rpi_rp2", return_value=rp2), mock.patch(
+                "pico_switcher.pico_device._BOOTSEL_GONE_TIMEOUT",
+                0.05,
+            ):
+                with self.assertRaises(OSError):
+                    copy_uf2(uf2_path=source, mountpoint=mountpoint, verbose=False)
+
+    def test_copy_uf2_rejects_missing_source(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with self.assertRaisesRegex(RuntimeError, "UF2 file not found"):
+                copy_uf2(uf2_path=Path(tmpdir) / "missing.uf2", mountpoint=Path(tmpdir), verbose=False)
+
+
+if __name__ == "__main__":
+    unittest.main()
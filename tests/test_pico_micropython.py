@@ -8,6 +8,7 @@ trigger path.
 
 from __future__ import annotations
 
+import subprocess
 import tempfile
 import unittest
 from pathlib import Path
@@ -20,7 +21,14 @@ from pico_switcher.pico_micropython import (
     build_managed_python_sync_plan,
     sync_managed_python_profile,
 )
-from pico_switcher.pico_mpremote import trigger_from_py
+from pico_switcher.pico_mpremote import (
+    PY_BOOTLOADER_CODE,
+    MpRemoteSession,
+    install_micropython_helpers,
+    probe_micropython,
+    run_mpremote,
+    trigger_from_py,
+)
 from pico_switcher.pico_profiles import ProfileConfigError, PythonProfile
 
 
@@ -143,5 +151,109 @@ class MicroPythonTriggerTests(unittest.TestCase):
         )
 
 
+class MicroPythonHelperInstallTests(unittest.TestCase):
+    def test_install_helpers_uses_one_mpremote_invocation(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            helper_a = Path(tmpdir) / "boot.py"
+            helper_b = Path(tmpdir) / "bootloader_trigger.py"
+            helper_a.write_text("# boot\n", encoding="utf-8")
+            helper_b.write_text("# trigger\n", encoding="utf-8")
+
+            with mock.patch("pico_switcher.pico_mpremote.resolve_serial_port", return_value="/dev/ttyACM0"), mock.patch(
+                "pico_switcher.pico_mpremote.run_mpremote"
+            ) as run_mock:
+                install_micropython_helpers(port="auto", helper_files=(helper_a, helper_b))
+
+        run_mock.assert_called_once_with(
+            ["connect", "/dev/ttyACM0", "fs", "cp", str(helper_a), str(helper_b), ":"],
+            quiet=True,
+            discard_stdout=True,
+        )
+
+    def test_install_helpers_rejects_missing_helper_before_mpremote(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            helper = Path(tmpdir) / "boot.py"
+            helper.write_text("# boot\n", encoding="utf-8")
+            missing = Path(tmpdir) / "bootloader_trigger.py"
+
+            with mock.patch("pico_switcher.pico_mpremote.run_mpremote") as run_mock:
+                with self.assertRaisesRegex(RuntimeError, "Missing helper file: .*bootloader_trigger.py"):
+                    install_micropython_helpers(port="auto", helper_files=(helper, missing))
+
+        run_mock.assert_not_called()
+
+    def test_install_helpers_accepts_helpers_from_several_directories(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            helper_a = Path(tmpdir) / "a" / "boot.py"
+            helper_b = Path(tmpdir) / "b" / "bootloader_trigger.py"
+            for helper in (helper_a, helper_b):
+                helper.parent.mkdir()
+                helper.write_text("# helper\n", encoding="utf-8")
+
+            with mock.patch("pico_switcher.pico_mpremote.resolve_serial_port", return_value="/dev/ttyACM0"), mock.patch(
+                "pico_switcher.pico_mpremote.run_mpremote"
+            ) as run_mock:
+                install_micropython_helpers(port="auto", helper_files=(helper_a, helper_b))
+
+        run_mock.assert_called_once()
+
+
+class RunMpRemoteTests(unittest.TestCase):
+    def test_discard_stdout_captures_only_stderr(self) -> None:
+        process = mock.Mock(returncode=1, stdout=None, stderr="mpremote: cp: destination is read-only\n")
+        with mock.patch("pico_switcher.pico_mpremote.subprocess.run", return_value=process) as run_mock:
+            with self.assertRaisesRegex(RuntimeError, "destination is read-only"):
+                run_mpremote(["connect", "/dev/ttyACM0", "fs", "cp", "boot.py", ":"], quiet=True, discard_stdout=True)
+
+        self.assertIs(run_mock.call_args.kwargs["stdout"], subprocess.DEVNULL)
+        self.assertIs(run_mock.call_args.kwargs["stderr"], subprocess.PIPE)
+
+
+class MpRemoteSessionTests(unittest.TestCase):
+    def test_probe_and_trigger_share_one_transport(self) -> None:
+        transport = mock.Mock()
+        transport.exec.return_value = b"FW:PY\r\n"
+        with mock.patch("pico_switcher.pico_mpremote.resolve_serial_port", return_value="/dev/ttyACM0"), mock.patch(
+            "mpremote.transport_serial.SerialTransport",
+            return_value=transport,
+        ) as transport_factory, mock.patch("pico_switcher.pico_mpremote.run_mpremote") as run_mock:
+            with MpRemoteSession(port="auto") as session:
+                self.assertTrue(probe_micropython(port="auto", verbose=False, session=session))
+                self.assertIsNone(trigger_from_py(port="auto", verbose=False, session=session))
+
+        transport_factory.assert_called_once_with("/dev/ttyACM0", baudrate=115200)
+        transport.enter_raw_repl.assert_called_once_with()
+        transport.exec_raw_no_follow.assert_called_once_with(PY_BOOTLOADER_CODE)
+        transport.close.assert_called_once_with()
+        run_mock.assert_not_called()
+
+    def test_probe_reports_false_when_raw_repl_is_unavailable(self) -> None:
+        from mpremote.transport import TransportError
+
+        transport = mock.Mock()
+        transport.enter_raw_repl.side_effect = TransportError("could not enter raw repl")
+        with mock.patch("pico_switcher.pico_mpremote.resolve_serial_port", return_value="/dev/ttyACM0"), mock.patch(
+            "mpremote.transport_serial.SerialTransport",
+            return_value=transport,
+        ):
+            with MpRemoteSession(port="auto") as session:
+                self.assertFalse(probe_micropython(port="auto", verbose=False, session=session))
+
+        transport.close.assert_called_once_with()
+
+    def test_subprocess_path_is_used_when_transport_is_unavailable(self) -> None:
+        process = mock.Mock(returncode=0)
+        with mock.patch("pico_switcher.pico_mpremote._load_mpremote_transport", return_value=None), mock.patch(
+            "pico_switcher.pico_mpremote.resolve_serial_port",
+            return_value="/dev/ttyACM0",
+        ), mock.patch("pico_switcher.pico_mpremote.run_mpremote", return_value=process) as run_mock:
+            with MpRemoteSession(port="auto") as session:
+                self.assertFalse(session.available())
+                self.assertTrue(probe_micropython(port="auto", verbose=False, session=session))
+
+        run_mock.assert_called_once()
+        self.assertEqual(run_mock.call_args.args[0][2], "exec")
+
+
 if __name__ == "__main__":
     unittest.main()
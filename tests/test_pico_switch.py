@@ -0,0 +1,116 @@
+"""Tests for the high-level firmware switching workflow.
+
+The device and `mpremote` layers are mocked so these tests only check how
+`pico_switch` sequences detection, BOOTSEL entry, and flashing.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from pico_switcher.cli.handlers import run_detect
+from pico_switcher.pico_switch import detect_mode, switch_firmware
+
+
+class DetectModeTests(unittest.TestCase):
+    def test_detect_mode_reports_missing_port_without_serial_stages(self) -> None:
+        recorder = mock.Mock()
+        with mock.patch("pico_switcher.pico_switch.find_rpi_rp2", return_value=None), mock.patch(
+            "pico_switcher.pico_device.list_serial_port_candidates",
+            return_value=(),
+        ), mock.patch("pico_switcher.pico_switch.read_banner") as banner_mock, mock.patch(
+            "pico_switcher.pico_switch.probe_micropython"
+        ) as probe_mock:
+            with self.assertRaisesRegex(RuntimeError, "Serial port not found: /nonexistent/ttyACM9"):
+                detect_mode(port="/nonexistent/ttyACM9", timeout=1.5, verbose=False, recorder=recorder)
+
+        banner_mock.assert_not_called()
+        probe_mock.assert_not_called()
+
+    def test_cli_detect_surfaces_missing_port_error(self) -> None:
+        args = argparse.Namespace(port="/nonexistent/ttyACM9", timeout=1.5, verbose=False)
+        with mock.patch("pico_switcher.pico_switch.find_rpi_rp2", return_value=None), mock.patch(
+            "pico_switcher.pico_device.list_serial_port_candidates",
+            return_value=("/dev/ttyACM1",),
+        ):
+            with self.assertRaisesRegex(RuntimeError, "Available USB serial ports: /dev/ttyACM1"):
+                run_detect(args, recorder=mock.Mock())
+
+
+class SwitchFirmwareTests(unittest.TestCase):
+    def test_switch_from_cpp_reuses_detection_serial_handle_for_trigger(self) -> None:
+        read_fd, write_fd = os.pipe()
+        self.addCleanup(os.close, read_fd)
+        os.write(write_fd, b"FW:CPP\r\n")
+        os.close(write_fd)
+        serial_handle = mock.MagicMock()
+        serial_handle.fileno.return_value = read_fd
+        serial_context = mock.MagicMock()
+        serial_context.__enter__.return_value = serial_handle
+
+        with mock.patch("pico_switcher.pico_switch.find_rpi_rp2", return_value=None), mock.patch(
+            "pico_switcher.pico_switch.serial_port_present",
+            return_value=True,
+        ), mock.patch("pico_switcher.pico_device.resolve_serial_port", return_value="/dev/ttyACM0"), mock.patch(
+            "serial.Serial",
+            return_value=serial_context,
+        ) as serial_factory, mock.patch(
+            "pico_switcher.pico_switch.wait_for_bootsel_mount",
+            return_value=Path("/media/RPI-RP2"),
+        ), mock.patch("pico_switcher.pico_switch.copy_uf2") as copy_mock, mock.patch(
+            "pico_switcher.pico_mpremote._load_mpremote_transport"
+        ) as transport_loader:
+            flashed = switch_firmware(
+                target="py",
+                port="/dev/ttyACM0",
+                mode="auto",
+                uf2_path=Path("/tmp/micropython.uf2"),
+                mount_base="/mnt/pico",
+                detect_timeout=0.5,
+                bootsel_timeout=1.0,
+                install_helpers=False,
+                helper_files=None,
+                serial_wait=1.0,
+                force_flash=False,
+                verbose=False,
+            )
+
+        self.assertTrue(flashed)
+        serial_factory.assert_called_once()
+        serial_handle.write.assert_called_once_with(b"BOOTSEL\nb")
+        serial_context.__exit__.assert_called_once()
+        copy_mock.assert_called_once()
+        # A C++ switch never touches mpremote, so its transport is not imported.
+        transport_loader.assert_not_called()
+
+    def test_switch_reports_missing_port_instead_of_mode_hint(self) -> None:
+        with mock.patch("pico_switcher.pico_switch.find_rpi_rp2", return_value=None), mock.patch(
+            "pico_switcher.pico_device.list_serial_port_candidates",
+            return_value=(),
+        ), mock.patch("pico_switcher.pico_switch.read_banner") as banner_mock:
+            with self.assertRaisesRegex(RuntimeError, "Serial port not found: /nonexistent/ttyACM9") as ctx:
+                switch_firmware(
+                    target="py",
+                    port="/nonexistent/ttyACM9",
+                    mode="auto",
+                    uf2_path=Path("/tmp/micropython.uf2"),
+                    mount_base="/mnt/pico",
+                    detect_timeout=0.5,
+                    bootsel_timeout=1.0,
+                    install_helpers=False,
+                    helper_files=None,
+                    serial_wait=1.0,
+                    force_flash=False,
+                    verbose=False,
+                )
+
+        self.assertNotIn("Could not detect current mode", str(ctx.exception))
+        banner_mock.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()